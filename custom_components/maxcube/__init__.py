@@ -1,10 +1,17 @@
 """Support for the MAX! Cube LAN Gateway."""
 
 import asyncio
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+import copy
+from dataclasses import dataclass
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
+import random
 from threading import Lock
 import time
+from types import MappingProxyType
+from typing import Any, TypeVar
 
 from maxcube.cube import MaxCube
 from maxcube.device import MaxDevice
@@ -15,7 +22,7 @@ from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_STOP,
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr # Import device registry
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity import DeviceInfo, Entity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util.dt import now # Import now from Home Assistant utils
 
@@ -23,12 +30,35 @@ from .const import DATA_MAXCUBE_HANDLE, DOMAIN, MANUFACTURER
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # Define platforms to be set up
 PLATFORMS = [Platform.CLIMATE, Platform.BINARY_SENSOR]
 
 # Define a reasonable default scan interval
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
+# Adaptive polling: back off while nothing changes, within these bounds
+MIN_SCAN_INTERVAL = timedelta(seconds=15)
+MAX_SCAN_INTERVAL = timedelta(seconds=300)
+# Number of unchanged polls before the interval is doubled
+UNCHANGED_POLLS_BEFORE_BACKOFF = 3
+# Random jitter (seconds) so multiple cubes don't poll in lockstep
+SCAN_INTERVAL_JITTER = 2.0
+
+# Longest poll interval for which the cube connection is kept open between polls
+PERSISTENT_CONNECTION_MAX_INTERVAL = timedelta(seconds=300)
+
+# Consecutive update failures before the traceback is logged
+FAILURES_BEFORE_TRACEBACK = 3
+
+# How often to re-read the full device/room configuration from the cube.
+# In between, the persistent connection only polls device state.
+FULL_UPDATE_INTERVAL = timedelta(hours=1)
+
+# Delay used to coalesce rapid successive commands into one executor job
+COMMAND_DEBOUNCE_COOLDOWN = 0.3
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MAX! Cube from a config entry."""
@@ -40,9 +70,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # The coordinator will manage the background updates.
     coordinator = MaxCubeDataUpdateCoordinator(hass, host, port, DEFAULT_SCAN_INTERVAL)
 
-    # Fetch initial data so we have data when entities subscribe
-    # Raises ConfigEntryNotReady on failure
-    await coordinator.async_config_entry_first_refresh()
+    # Connecting performs the initial full read, keep it off the event loop.
+    # The read also provides the initial data, so no first refresh is needed.
+    try:
+        await coordinator.async_connect()
+    except Exception as err:
+        raise ConfigEntryNotReady(f"Unable to connect to MAX! Cube {host}: {err}") from err
+    # Disconnect and release the executor on unload. HA also runs this if
+    # the rest of the setup fails, so the cube's single client slot is freed.
+    entry.async_on_unload(coordinator.async_unload)
 
     # Store the coordinator object for platforms to access
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
@@ -51,11 +87,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     device_registry = dr.async_get(hass)
     gateway_device = device_registry.async_get_or_create(
         config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, coordinator.cube.serial)}, # Use cube serial as identifier
+        identifiers={(DOMAIN, coordinator.data.serial)}, # Use cube serial as identifier
         name=f"MAX! Cube ({host})",
         manufacturer=MANUFACTURER,
         model="MAX! Cube LAN Gateway",
-        sw_version=coordinator.cube.firmware_version, # Get firmware from the cube itself
+        sw_version=coordinator.data.firmware_version, # Get firmware from the cube itself
         configuration_url=f"http://{host}", # Add configuration URL if accessible
     )
     _LOGGER.debug("Registered gateway device: %s", gateway_device.id)
@@ -70,15 +106,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     def _async_disconnect(event: Event) -> None:
         """Disconnect from MAX! Cube on HA stop."""
         _LOGGER.info("Disconnecting from MAX! Cube %s", host)
-        # Run blocking disconnect in executor
-        hass.async_add_executor_job(coordinator.cube.disconnect)
+        # Shutting down: schedule the disconnect without waiting for it
+        coordinator.async_disconnect()
 
     entry.async_on_unload(
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_disconnect)
     )
-    # Add listener to disconnect when entry is unloaded
-    entry.async_on_unload(coordinator.async_unload)
-
 
     return True
 
@@ -91,8 +124,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         # Remove the coordinator from hass.data
         coordinator: MaxCubeDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        # Drop cached device info so a reload picks up renamed rooms/devices
+        for device in coordinator.data.devices.values():
+            _DEVICE_INFO_CACHE.pop(device.serial, None)
+        # Stop sending queued commands so no flush can reconnect after this
+        coordinator.async_shutdown_commands()
         # Ensure disconnection happens in executor
-        await hass.async_add_executor_job(coordinator.cube.disconnect)
+        if (disconnect := coordinator.async_disconnect()) is not None:
+            await disconnect
         # Clean up hass.data[DOMAIN] if it's empty
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN)
@@ -100,7 +139,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
-class MaxCubeDataUpdateCoordinator(DataUpdateCoordinator[MaxCube]):
+@dataclass(frozen=True, slots=True)
+class CubeSnapshot:
+    """Immutable view of the cube state taken after an update."""
+
+    devices: Mapping[str, MaxDevice] # rf_address -> device
+    thermostats_by_room: Mapping[int, tuple[MaxDevice, ...]] # room_id -> thermostats
+    # Devices classified per platform in the same pass
+    climate_devices: tuple[MaxDevice, ...] # Thermostats and wall thermostats
+    shutters: tuple[MaxDevice, ...] # Window shutters
+    battery_devices: tuple[MaxDevice, ...] # Devices reporting a battery state
+    serial: str
+    firmware_version: str
+
+
+class MaxCubeDataUpdateCoordinator(DataUpdateCoordinator[CubeSnapshot]):
     """Class to manage fetching MAX! Cube data."""
 
     config_entry: ConfigEntry
@@ -113,13 +166,40 @@ class MaxCubeDataUpdateCoordinator(DataUpdateCoordinator[MaxCube]):
         update_interval: timedelta,
     ) -> None:
         """Initialize."""
-        self.cube = MaxCube(host, port, now=now) # Pass now function
+        self.cube: MaxCube # Created by async_connect
         self._host = host # Store host for logging
+        self._port = port
+        self._update_interval = update_interval
         self._hass = hass # Store hass instance
-        self._update_lock = asyncio.Lock() # Use asyncio lock
-
-        # Determine if persistent connection should be used based on update interval
-        self.cube.use_persistent_connection = update_interval <= timedelta(seconds=300)
+        # Private single worker for cube I/O: the cube speaks over one TCP
+        # connection, so calls must be serialized and should not occupy
+        # threads of HA's shared executor.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"maxcube-{host}"
+        )
+        self._disconnected = False # Set once disconnect was scheduled
+        # Entity state writes batched until the listener fan-out finishes
+        self._pending_writes: list[Entity] = []
+        self._write_scheduled = False
+        # Pending commands per device serial: (device, temperature, mode)
+        self._pending_cmds: dict[str, tuple[MaxDevice, float | None, int | None]] = {}
+        # Resolved (or failed) once the pending batch has been sent
+        self._batch_future: asyncio.Future[None] | None = None
+        # Timer for the next flush; not armed while a flush is in progress,
+        # the running flush re-arms it for commands that arrived meanwhile
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flushing = False
+        self._commands_shutdown = False
+
+        self._full_update_interval = FULL_UPDATE_INTERVAL
+        self._last_full: datetime | None = None
+
+        # Adaptive polling state
+        self._base_interval = update_interval
+        self._current_interval = update_interval # Interval before jitter
+        self._last_state_hash: int | None = None
+        self._unchanged_polls = 0
+        self._consecutive_failures = 0
 
         super().__init__(
             hass,
@@ -128,76 +208,349 @@ class MaxCubeDataUpdateCoordinator(DataUpdateCoordinator[MaxCube]):
             update_interval=update_interval,
         )
 
-    async def _async_update_data(self) -> MaxCube:
+    async def _async_update_data(self) -> CubeSnapshot:
         """Fetch data from MAX! Cube.
 
         This is the core function of the coordinator.
         It runs in the event loop and schedules the blocking update call.
         """
-        async with self._update_lock: # Prevent concurrent updates
-            try:
-                _LOGGER.debug("Updating data from MAX! Cube %s", self._host)
-                # Run the blocking update call in the executor
-                await self._hass.async_add_executor_job(self.cube.update)
-                _LOGGER.debug("Update finished for %s. Found %d devices.", self._host, len(self.cube.devices))
-                # Return the updated cube object (contains all device data)
-                return self.cube
-            except TimeoutError as err:
-                # Let UpdateFailed handle the exception and logging
-                _LOGGER.warning("Timeout communicating with MAX! Cube %s: %s", self._host, err)
-                raise UpdateFailed(f"Timeout communicating with MAX! Cube {self._host}: {err}") from err
-            except Exception as err:
-                # Catch unexpected errors during update
+        # DataUpdateCoordinator already serializes refreshes
+        try:
+            _LOGGER.debug("Updating data from MAX! Cube %s", self._host)
+            # Run the blocking update call in the executor
+            full = self._last_full is None or now() - self._last_full > self._full_update_interval
+            snapshot = await self.run_cube(self._update_cube, full)
+            if full:
+                self._last_full = now()
+            _LOGGER.debug("Update finished for %s. Found %d devices.", self._host, len(snapshot.devices))
+            self._adapt_update_interval(snapshot)
+            self._consecutive_failures = 0
+            return snapshot
+        except TimeoutError as err:
+            # Let UpdateFailed handle the exception and logging
+            self._consecutive_failures += 1
+            raise UpdateFailed(f"Timeout communicating with MAX! Cube {self._host}: {err}") from err
+        except Exception as err:
+            # Catch unexpected errors during update
+            # Transient failures are common, only format the traceback when they persist
+            self._consecutive_failures += 1
+            if self._consecutive_failures < FAILURES_BEFORE_TRACEBACK:
+                _LOGGER.warning("Error communicating with MAX! Cube %s: %s", self._host, err)
+            else:
                 _LOGGER.error("Error communicating with MAX! Cube %s: %s", self._host, err, exc_info=True)
-                raise UpdateFailed(f"Error communicating with MAX! Cube {self._host}: {err}") from err
+            raise UpdateFailed(f"Error communicating with MAX! Cube {self._host}: {err}") from err
+
+    async def async_connect(self) -> None:
+        """Connect to the MAX! Cube in the private executor.
+
+        Seeds the coordinator data from the full read done while connecting.
+        """
+        try:
+            snapshot = await self.run_cube(self._connect)
+        except Exception:
+            self._executor.shutdown(wait=False)
+            raise
+        # MaxCube() already performed a full read on connect
+        self._last_full = now()
+        self._adapt_update_interval(snapshot)
+        self.async_set_updated_data(snapshot)
+
+    def _connect(self) -> CubeSnapshot:
+        """Connect to the cube and snapshot it (runs in executor)."""
+        self.cube = MaxCube(self._host, self._port, now=now) # Pass now function
+        # Determine if persistent connection should be used based on update interval
+        self.cube.use_persistent_connection = self._update_interval <= PERSISTENT_CONNECTION_MAX_INTERVAL
+        return self._build_snapshot()
+
+    def _build_snapshot(self) -> CubeSnapshot:
+        """Copy the cube's devices into a pre-indexed, immutable snapshot.
+
+        The library mutates its device objects in place on the next update
+        and when sending commands, so each device is copied to keep the
+        snapshot stable for entities. Must run on the cube executor so the
+        copy is serialized with those writes.
+        """
+        devices: dict[str, MaxDevice] = {}
+        thermostats_by_room: dict[int, list[MaxDevice]] = {}
+        climate_devices: list[MaxDevice] = []
+        shutters: list[MaxDevice] = []
+        battery_devices: list[MaxDevice] = []
+        for device in self.cube.devices:
+            device = copy.copy(device)
+            devices[device.rf_address] = device
+            if device.is_thermostat():
+                thermostats_by_room.setdefault(device.room_id, []).append(device)
+                climate_devices.append(device)
+            elif device.is_wallthermostat():
+                climate_devices.append(device)
+            elif device.is_windowshutter():
+                shutters.append(device)
+            if getattr(device, 'battery', None) is not None:
+                battery_devices.append(device)
+        return CubeSnapshot(
+            devices=MappingProxyType(devices),
+            thermostats_by_room=MappingProxyType(
+                {room_id: tuple(devs) for room_id, devs in thermostats_by_room.items()}
+            ),
+            climate_devices=tuple(climate_devices),
+            shutters=tuple(shutters),
+            battery_devices=tuple(battery_devices),
+            serial=self.cube.serial,
+            firmware_version=self.cube.firmware_version,
+        )
+
+    def _adapt_update_interval(self, snapshot: CubeSnapshot) -> None:
+        """Back off polling while device state is unchanged, speed up on change."""
+        state_hash = hash(
+            tuple(
+                (
+                    d.rf_address,
+                    getattr(d, 'mode', None),
+                    getattr(d, 'target_temperature', None),
+                    getattr(d, 'valve_position', 0),
+                    getattr(d, 'battery', 0),
+                    getattr(d, 'is_open', None),
+                )
+                for d in snapshot.devices.values()
+            )
+        )
+        if state_hash != self._last_state_hash:
+            self._last_state_hash = state_hash
+            self._unchanged_polls = 0
+            self._current_interval = self._base_interval
+        else:
+            self._unchanged_polls += 1
+            if self._unchanged_polls >= UNCHANGED_POLLS_BEFORE_BACKOFF:
+                self._unchanged_polls = 0
+                self._current_interval = min(MAX_SCAN_INTERVAL, self._current_interval * 2)
+
+        seconds = self._current_interval.total_seconds() + random.uniform(
+            -SCAN_INTERVAL_JITTER, SCAN_INTERVAL_JITTER
+        )
+        self.update_interval = min(
+            MAX_SCAN_INTERVAL, max(MIN_SCAN_INTERVAL, timedelta(seconds=seconds))
+        )
+
+    def _update_cube(self, full: bool) -> CubeSnapshot:
+        """Update the cube data and snapshot it (runs in executor).
+
+        On an open persistent connection the cube only sends device state
+        (L message). Reconnecting makes it resend the full configuration
+        (H/M/C messages), so a full update is a reconnect followed by update.
+        """
+        if full and self.cube.use_persistent_connection:
+            _LOGGER.debug("Performing full configuration update for %s", self._host)
+            self.cube.disconnect()
+        self.cube.update()
+        return self._build_snapshot()
+
+    @callback
+    def async_request_full_update(self) -> None:
+        """Make the next refresh re-read the full cube configuration."""
+        self._last_full = None
+
+    async def run_cube(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking cube call in the integration's private executor."""
+        return await self._hass.loop.run_in_executor(self._executor, func, *args)
+
+    async def async_set_temperature_mode(
+        self, device: MaxDevice, temperature: float | None, mode: int | None
+    ) -> None:
+        """Queue a temperature/mode command for a device.
+
+        Commands arriving in quick succession are coalesced (last one per
+        device wins) and sent in a single executor job followed by one refresh.
+        Returns once the batch containing this command was sent, and raises
+        the send error if it failed.
+        """
+        if self._commands_shutdown:
+            raise RuntimeError(f"MAX! Cube {self._host} is unloading")
+        self._pending_cmds[device.serial] = (device, temperature, mode)
+        if self._batch_future is None:
+            self._batch_future = self._hass.loop.create_future()
+        batch = self._batch_future
+        self._schedule_flush()
+        await batch
+
+    @callback
+    def _schedule_flush(self) -> None:
+        """Arm the flush timer unless it is armed or a flush is running."""
+        if self._flushing or self._flush_handle is not None:
+            return
+        self._flush_handle = self._hass.loop.call_later(
+            COMMAND_DEBOUNCE_COOLDOWN, self._start_flush
+        )
+
+    @callback
+    def _start_flush(self) -> None:
+        """Start flushing the pending commands (timer callback)."""
+        self._flush_handle = None
+        self._flushing = True
+        self._hass.async_create_task(self._async_flush_commands())
+
+    async def _async_flush_commands(self) -> None:
+        """Send all pending commands to the MAX! Cube, then request a refresh."""
+        commands = list(self._pending_cmds.values())
+        self._pending_cmds.clear()
+        batch, self._batch_future = self._batch_future, None
+        try:
+            if not commands:
+                return
+            try:
+                # Run blocking network I/O in executor
+                await self.run_cube(self._send_commands, commands)
+            except Exception as err: # Network and library errors
+                _LOGGER.error("Error sending commands to MAX! Cube %s: %s", self._host, err)
+                if batch is not None and not batch.done():
+                    batch.set_exception(err)
+                return
+            if batch is not None and not batch.done():
+                batch.set_result(None)
+            # Request a refresh to get updated state, without holding up
+            # commands queued while this batch was being sent
+            if not self._commands_shutdown:
+                self._hass.async_create_task(self.async_request_refresh())
+        finally:
+            self._flushing = False
+            if self._pending_cmds and not self._commands_shutdown:
+                self._schedule_flush()
+
+    @callback
+    def async_shutdown_commands(self) -> None:
+        """Stop sending queued commands and fail any waiting callers."""
+        self._commands_shutdown = True
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_cmds.clear()
+        batch, self._batch_future = self._batch_future, None
+        if batch is not None and not batch.done():
+            batch.set_exception(RuntimeError(f"MAX! Cube {self._host} is unloading"))
+
+    def _send_commands(
+        self, commands: list[tuple[MaxDevice, float | None, int | None]]
+    ) -> None:
+        """Send queued commands to the cube (runs in executor).
+
+        The library writes the new mode/temperature back onto the device it
+        is given, so commands go to its live device, not the snapshot copy.
+        The library reports an unacknowledged radio message by returning
+        False; the remaining commands are still sent before raising.
+        """
+        failed: list[str] = []
+        for device, temperature, mode in commands:
+            live_device = self.cube.device_by_rf(device.rf_address)
+            if live_device is None:
+                _LOGGER.warning("Device %s no longer known to MAX! Cube %s", device.rf_address, self._host)
+                continue
+            if self.cube.set_temperature_mode(live_device, temperature, mode) is False:
+                failed.append(device.rf_address)
+        if failed:
+            raise OSError(f"MAX! Cube {self._host} did not confirm command for {', '.join(failed)}")
+
+    @callback
+    def async_schedule_state_write(self, entity: Entity) -> None:
+        """Queue an entity state write for the end of the current update.
+
+        All entities are notified of an update one after another; deferring
+        their writes to a single loop callback coalesces the state changes.
+        """
+        self._pending_writes.append(entity)
+        if not self._write_scheduled:
+            self._write_scheduled = True
+            self._hass.loop.call_soon(self._flush_writes)
+
+    @callback
+    def _flush_writes(self) -> None:
+        """Write the state of all queued entities."""
+        entities = self._pending_writes
+        self._pending_writes = []
+        self._write_scheduled = False
+        for entity in entities:
+            # Skip entities removed since the write was queued
+            if entity.hass is not None and entity.platform is not None:
+                entity.async_write_ha_state()
+
+    @callback
+    def async_disconnect(self) -> asyncio.Future[None] | None:
+        """Schedule the cube disconnect unless it was already scheduled.
+
+        Returns the executor future, or None if a disconnect already ran.
+        """
+        if self._disconnected:
+            return None
+        self._disconnected = True
+        return self._hass.loop.run_in_executor(self._executor, self._disconnect)
+
+    def _disconnect(self) -> None:
+        """Disconnect from the cube (runs in executor)."""
+        # Catch everything: on HA stop nobody awaits the returned future
+        try:
+            self.cube.disconnect()
+        except Exception as err: # pylint: disable=broad-except
+            _LOGGER.debug("Error disconnecting from MAX! Cube %s: %s", self._host, err)
 
     @callback
     def async_unload(self) -> None:
         """Clean up resources when the coordinator is unloaded."""
         # This method is called when the entry is unloaded
         _LOGGER.debug("Initiating disconnection for %s", self._host)
+        self.async_shutdown_commands()
         # Run the blocking disconnect call in the executor
         # We don't await this directly as unload should be quick
-        self._hass.async_add_executor_job(self.cube.disconnect)
+        self.async_disconnect()
+        # Queued work still runs, but no new work is accepted
+        self._executor.shutdown(wait=False)
+
+# Map device types to model names once at import time
+try:
+    from maxcube.device import (
+         MAX_CUBE, MAX_THERMOSTAT, MAX_THERMOSTAT_PLUS,
+         MAX_WALL_THERMOSTAT, MAX_WINDOW_SHUTTER, MAX_ECO_SWITCH
+    )
+    _DEVICE_TYPE_MAP: dict[int, str] | None = {
+        MAX_THERMOSTAT: "Thermostat",
+        MAX_THERMOSTAT_PLUS: "Thermostat+",
+        MAX_WALL_THERMOSTAT: "Wall Thermostat",
+        MAX_WINDOW_SHUTTER: "Window Shutter",
+        MAX_ECO_SWITCH: "Eco Switch",
+        MAX_CUBE: "Cube" # Should not happen here, but include for completeness
+    }
+except ImportError:
+    # Constants are not available in the installed library version
+    _DEVICE_TYPE_MAP = None
+
+# DeviceInfo per device serial, cleared when the owning entry is unloaded
+_DEVICE_INFO_CACHE: dict[str, DeviceInfo] = {}
+
 
 # Helper function to get device info - used by platforms
 def get_max_device_info(cube: MaxCube, device: MaxDevice) -> DeviceInfo:
     """Get device info for a MAX! device."""
+    if (cached := _DEVICE_INFO_CACHE.get(device.serial)) is not None:
+        return cached
+
     room = cube.room_by_id(device.room_id)
     room_name = room.name if room else "Unknown Room"
     device_name = f"{room_name} {device.name}"
 
     # Determine model based on type (add more types as needed)
     model = "Unknown Device"
-    # Use constants from maxcube library if available, otherwise strings
-    try:
-        from maxcube.device import (
-             MAX_CUBE, MAX_THERMOSTAT, MAX_THERMOSTAT_PLUS,
-             MAX_WALL_THERMOSTAT, MAX_WINDOW_SHUTTER, MAX_ECO_SWITCH
-        )
-        DEVICE_TYPE_MAP = {
-            MAX_THERMOSTAT: "Thermostat",
-            MAX_THERMOSTAT_PLUS: "Thermostat+",
-            MAX_WALL_THERMOSTAT: "Wall Thermostat",
-            MAX_WINDOW_SHUTTER: "Window Shutter",
-            MAX_ECO_SWITCH: "Eco Switch",
-            MAX_CUBE: "Cube" # Should not happen here, but include for completeness
-        }
-        model = DEVICE_TYPE_MAP.get(device.type, f"Unknown Type ({device.type})")
-    except ImportError:
-        # Fallback if constants are not available in the installed library version
-        if device.is_thermostat():
-            model = "Thermostat"
-        elif device.is_wallthermostat():
-            model = "Wall Thermostat"
-        elif device.is_windowshutter():
-            model = "Window Shutter"
-        # Add other types if needed
+    if _DEVICE_TYPE_MAP is not None:
+        model = _DEVICE_TYPE_MAP.get(device.type, f"Unknown Type ({device.type})")
+    # Fallback if constants are not available in the installed library version
+    elif device.is_thermostat():
+        model = "Thermostat"
+    elif device.is_wallthermostat():
+        model = "Wall Thermostat"
+    elif device.is_windowshutter():
+        model = "Window Shutter"
+    # Add other types if needed
 
     # Safely get firmware_version using getattr, default to None if not present
     sw_version = getattr(device, 'firmware_version', None)
 
-    return DeviceInfo(
+    device_info = DeviceInfo(
         identifiers={(DOMAIN, device.serial)},
         name=device_name,
         manufacturer=MANUFACTURER,
@@ -206,4 +559,5 @@ def get_max_device_info(cube: MaxCube, device: MaxDevice) -> DeviceInfo:
         # Link device to the gateway device
         via_device=(DOMAIN, cube.serial),
     )
-
+    _DEVICE_INFO_CACHE[device.serial] = device_info
+    return device_info
@@ -32,27 +32,31 @@ async def async_setup_entry(
     """Set up the MAX! Cube binary sensor platform."""
     # Get the coordinator for this config entry
     coordinator: MaxCubeDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-    cube = coordinator.cube # Access the cube object from the coordinator
 
-    # Find all devices and create entities
-    entities: list[MaxCubeBinarySensorBase] = []
-    for device in cube.devices:
-        # Create battery sensor for all devices that report battery level
-        # Check if battery attribute exists and is not None before creating sensor
-        if hasattr(device, 'battery') and device.battery is not None:
-             entities.append(MaxCubeBattery(coordinator, device))
-
-        # Create window shutter sensor if applicable
-        if device.is_windowshutter():
-            entities.append(MaxCubeShutter(coordinator, device))
+    # Create entities from the devices classified by the coordinator
+    data = coordinator.data
+    entities: list[MaxCubeBinarySensorBase] = [
+        # Battery sensor for all devices that report a battery state
+        *(MaxCubeBattery(coordinator, device) for device in data.battery_devices),
+        # Window shutter sensor where applicable
+        *(MaxCubeShutter(coordinator, device) for device in data.shutters),
+    ]
 
     if entities:
         async_add_entities(entities)
 
 
+def _read_unknown() -> None:
+    """Return an unknown state for devices lacking the attribute."""
+    return None
+
+
 class MaxCubeBinarySensorBase(CoordinatorEntity[MaxCubeDataUpdateCoordinator], BinarySensorEntity):
     """Base class for maxcube binary sensors."""
 
+    # Per-instance attributes introduced here; base classes still use __dict__
+    __slots__ = ("_device", "_cube", "_fp")
+
     _attr_has_entity_name = True # Use device name as entity name base
     # Associate the entity description defined in subclasses
     entity_description: BinarySensorEntityDescription
@@ -66,22 +70,39 @@ class MaxCubeBinarySensorBase(CoordinatorEntity[MaxCubeDataUpdateCoordinator], B
         self._attr_device_info = get_max_device_info(self._cube, self._device)
         # Set unique ID based on device serial and sensor type (from entity_description)
         self._attr_unique_id = f"{self._device.serial}_{self.entity_description.key}"
+        self._fp = self._fingerprint(self._device)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         # Find the device instance in the coordinator's data
         # Use the rf_address for reliable lookup
-        updated_device = self.coordinator.data.device_by_rf(self._device.rf_address)
+        updated_device = self.coordinator.data.devices.get(self._device.rf_address)
         if updated_device:
+            # Skip the state write if nothing relevant changed
+            fp = self._fingerprint(updated_device)
+            if fp == self._fp:
+                return
+            self._fp = fp
             self._device = updated_device # Update the internal device state
-            self.async_write_ha_state() # Update HA state
+            self.coordinator.async_schedule_state_write(self) # Update HA state (batched)
         else:
             _LOGGER.warning("Device %s (%s) not found after update", self._device.name, self._device.rf_address)
+            # The device list may be stale, re-read the configuration next poll
+            self.coordinator.async_request_full_update()
             # Optionally mark the entity as unavailable
             # self._attr_available = False
             # self.async_write_ha_state()
 
+    def _fingerprint(self, device: MaxDevice) -> tuple:
+        """Return the device values that determine this entity's state."""
+        return (
+            getattr(device, 'battery', None),
+            getattr(device, 'is_open', None),
+            # Availability follows the coordinator's last update result
+            self.coordinator.last_update_success,
+        )
+
 
 class MaxCubeShutter(MaxCubeBinarySensorBase):
     """Representation of a MAX! Cube Window Shutter sensor."""
@@ -93,14 +114,24 @@ class MaxCubeShutter(MaxCubeBinarySensorBase):
         name="Window Open", # This will be appended to the device name
     )
 
+    __slots__ = ("_read_state",)
+
+    def __init__(self, coordinator: MaxCubeDataUpdateCoordinator, device: MaxDevice) -> None:
+        """Initialize MAX! Cube window shutter sensor."""
+        super().__init__(coordinator, device)
+        # Pick the state reader once; the device capabilities don't change
+        self._read_state = self._read_is_open if hasattr(device, 'is_open') else _read_unknown
+
+    def _read_is_open(self) -> bool:
+        """Return the window state of the current device."""
+        return self._device.is_open
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on/open."""
-        # Ensure device object is up-to-date via coordinator
         # The actual device state is already updated in _handle_coordinator_update
-        if self._device and hasattr(self._device, 'is_open'):
-             return self._device.is_open
-        return None # Return None if state is unknown
+        # Returns None if the state is unknown
+        return self._read_state()
 
 
 class MaxCubeBattery(MaxCubeBinarySensorBase):
@@ -114,13 +145,22 @@ class MaxCubeBattery(MaxCubeBinarySensorBase):
         name="Battery Low", # This will be appended to the device name
     )
 
+    __slots__ = ("_read_state",)
+
+    def __init__(self, coordinator: MaxCubeDataUpdateCoordinator, device: MaxDevice) -> None:
+        """Initialize MAX! Cube battery sensor."""
+        super().__init__(coordinator, device)
+        # Pick the state reader once; the device capabilities don't change
+        self._read_state = self._read_battery_low if hasattr(device, 'battery') else _read_unknown
+
+    def _read_battery_low(self) -> bool:
+        """Return the battery state of the current device."""
+        # MAX! Cube reports 1 for low battery, 0 for OK.
+        return self._device.battery == 1
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the battery is low (device.battery == 1)."""
-        # Ensure device object is up-to-date via coordinator
         # The actual device state is already updated in _handle_coordinator_update
-        if self._device and hasattr(self._device, 'battery'):
-            # MAX! Cube reports 1 for low battery, 0 for OK.
-            return self._device.battery == 1
-        return None # Return None if state is unknown
-
+        # Returns None if the state is unknown
+        return self._read_state()
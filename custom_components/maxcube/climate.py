@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 from maxcube.device import (
     MAX_DEVICE_MODE_AUTOMATIC,
@@ -46,6 +47,11 @@ ON_TEMPERATURE = 30.5
 MIN_TEMPERATURE = 5.0
 MAX_TEMPERATURE = 30.0
 
+# Shared read-only attributes for entities without extra state.
+# HA declares _attr_extra_state_attributes as dict[str, Any]; a read-only
+# mapping is used on purpose so no entity can mutate the shared instance.
+_EMPTY_ATTRS: MappingProxyType[str, Any] = MappingProxyType({})
+
 # Map MAX! Cube modes to Home Assistant HVAC modes and presets
 MODE_TO_HVAC_MODE = {
     MAX_DEVICE_MODE_AUTOMATIC: HVACMode.AUTO,
@@ -54,12 +60,34 @@ MODE_TO_HVAC_MODE = {
     MAX_DEVICE_MODE_BOOST: HVACMode.AUTO, # Boost is temporary, return to AUTO/HEAT afterwards
 }
 
+# (mode, target is OFF_TEMPERATURE) -> HVAC mode, so the update path is a single lookup.
+# Only a HEAT (manual) mode at OFF_TEMPERATURE is reported as OFF.
+_HVAC_TABLE = {
+    (mode, is_off): HVACMode.OFF if is_off and hvac_mode == HVACMode.HEAT else hvac_mode
+    for mode, hvac_mode in MODE_TO_HVAC_MODE.items()
+    for is_off in (True, False)
+}
+
 HVAC_MODE_TO_MODE = {
     HVACMode.AUTO: MAX_DEVICE_MODE_AUTOMATIC,
     HVACMode.HEAT: MAX_DEVICE_MODE_MANUAL,
     HVACMode.OFF: MAX_DEVICE_MODE_MANUAL, # Off is set via temperature in manual mode
 }
 
+
+class _Fingerprint(NamedTuple):
+    """Device values that determine a climate entity's state."""
+
+    mode: int | None
+    target_temperature: float | None
+    actual_temperature: float | None
+    valve_position: int
+    comfort_temperature: float | None
+    eco_temperature: float | None
+    # Availability follows the coordinator's last update result
+    last_update_success: bool
+
+
 # Define supported presets
 SUPPORT_PRESETS = [
     PRESET_BOOST,
@@ -78,13 +106,11 @@ async def async_setup_entry(
     """Set up the MAX! Cube climate platform."""
     # Get the coordinator for this config entry
     coordinator: MaxCubeDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-    cube = coordinator.cube # Access the cube object from the coordinator
 
-    # Find all thermostat devices and create entities
+    # Create entities for all thermostat devices (classified by the coordinator)
     entities = [
         MaxCubeClimate(coordinator, device)
-        for device in cube.devices
-        if device.is_thermostat() or device.is_wallthermostat()
+        for device in coordinator.data.climate_devices
     ]
 
     if entities:
@@ -94,6 +120,9 @@ async def async_setup_entry(
 class MaxCubeClimate(CoordinatorEntity[MaxCubeDataUpdateCoordinator], ClimateEntity):
     """MAX! Cube ClimateEntity."""
 
+    # Per-instance attributes introduced here; base classes still use __dict__
+    __slots__ = ("_device", "_cube", "_fp", "_has_valve", "_is_thermo", "_is_wall")
+
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.AUTO, HVACMode.HEAT]
     _attr_supported_features = (
@@ -109,6 +138,16 @@ class MaxCubeClimate(CoordinatorEntity[MaxCubeDataUpdateCoordinator], ClimateEnt
         super().__init__(coordinator) # Initialize CoordinatorEntity
         self._device = device
         self._cube = coordinator.cube # Store cube reference for convenience
+        # Device capabilities are static, resolve them once
+        self._has_valve = hasattr(device, 'valve_position')
+        self._is_thermo = device.is_thermostat()
+        self._is_wall = device.is_wallthermostat()
+        # Temperature limits are static per device
+        # Use device limits if available, clamped to the absolute usable range
+        min_t = getattr(device, 'min_temperature', MIN_TEMPERATURE) or MIN_TEMPERATURE
+        self._attr_min_temp = max(min_t, MIN_TEMPERATURE)
+        max_t = getattr(device, 'max_temperature', MAX_TEMPERATURE) or MAX_TEMPERATURE
+        self._attr_max_temp = min(max_t, MAX_TEMPERATURE)
 
         # Generate Device Info
         self._attr_device_info = get_max_device_info(self._cube, self._device)
@@ -121,47 +160,40 @@ class MaxCubeClimate(CoordinatorEntity[MaxCubeDataUpdateCoordinator], ClimateEnt
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         # Find the device instance in the coordinator's data
-        updated_device = self.coordinator.data.device_by_rf(self._device.rf_address)
+        updated_device = self.coordinator.data.devices.get(self._device.rf_address)
         if updated_device:
+            # Skip attribute rebuild and state write if nothing relevant changed
+            fp = self._fingerprint(updated_device)
+            if fp == self._fp:
+                return
             self._device = updated_device # Update the internal device state
-            self._update_attrs() # Update attributes based on new state
-            self.async_write_ha_state() # Update HA state
+            self._update_attrs(fp) # Update attributes based on new state
+            self.coordinator.async_schedule_state_write(self) # Update HA state (batched)
         else:
             _LOGGER.warning("Device %s not found after update", self.unique_id)
+            # The device list may be stale, re-read the configuration next poll
+            self.coordinator.async_request_full_update()
             # Optionally mark the entity as unavailable
             # self._attr_available = False
             # self.async_write_ha_state()
 
     @callback
-    def _update_attrs(self) -> None:
-        """Update climate entity attributes based on the current device state."""
+    def _update_attrs(self, fp: _Fingerprint | None = None) -> None:
+        """Update climate entity attributes based on the current device state.
+
+        fp is the device's fingerprint if the caller already computed it.
+        """
+        if fp is None:
+            fp = self._fingerprint(self._device)
         # Determine HVAC mode
         mode = self._device.mode
         target_temp = self._device.target_temperature
 
-        if mode == MAX_DEVICE_MODE_MANUAL and target_temp == OFF_TEMPERATURE:
-            self._attr_hvac_mode = HVACMode.OFF
-        elif mode in MODE_TO_HVAC_MODE:
-             # Boost/Vacation might need special handling depending on desired HA representation
-             # For now, map them based on MODE_TO_HVAC_MODE
-             self._attr_hvac_mode = MODE_TO_HVAC_MODE[mode]
-             if self._attr_hvac_mode == HVACMode.HEAT and target_temp == OFF_TEMPERATURE:
-                 # If somehow in HEAT mode but temp is OFF, switch to OFF
-                 self._attr_hvac_mode = HVACMode.OFF
-        else:
-             self._attr_hvac_mode = None # Unknown mode
+        # Unknown modes map to None
+        self._attr_hvac_mode = _HVAC_TABLE.get((mode, target_temp == OFF_TEMPERATURE))
 
         # Determine HVAC action
-        valve = 0
-        if self._device.is_thermostat() and hasattr(self._device, 'valve_position'):
-            valve = self._device.valve_position
-        elif self._device.is_wallthermostat():
-            # Find associated thermostat's valve position
-            room = self._cube.room_by_id(self._device.room_id)
-            if room:
-                for dev in self._cube.devices_by_room(room):
-                    if dev.is_thermostat() and hasattr(dev, 'valve_position') and dev.valve_position > valve:
-                        valve = dev.valve_position
+        valve = fp.valve_position # Reuse the room valve scan done for the fingerprint
 
         if self._attr_hvac_mode == HVACMode.OFF:
             self._attr_hvac_action = HVACAction.OFF
@@ -177,7 +209,7 @@ class MaxCubeClimate(CoordinatorEntity[MaxCubeDataUpdateCoordinator], ClimateEnt
         if self._attr_hvac_mode != HVACMode.OFF:
             # Ensure target temp is within valid HA range
             temp = self._device.target_temperature
-            if temp is not None and self.min_temp <= temp <= self.max_temp:
+            if temp is not None and self._attr_min_temp <= temp <= self._attr_max_temp:
                  self._attr_target_temperature = temp
             else:
                  # If target is invalid (e.g., ON_TEMPERATURE), try to get a sensible default
@@ -195,10 +227,37 @@ class MaxCubeClimate(CoordinatorEntity[MaxCubeDataUpdateCoordinator], ClimateEnt
         self._attr_preset_mode = self._get_current_preset()
 
         # Update extra state attributes (valve position)
-        extra_attrs = {}
-        if self._device.is_thermostat() and hasattr(self._device, 'valve_position'):
-             extra_attrs[ATTR_VALVE_POSITION] = self._device.valve_position
-        self._attr_extra_state_attributes = extra_attrs
+        if self._has_valve and self._is_thermo:
+            self._attr_extra_state_attributes = {ATTR_VALVE_POSITION: self._device.valve_position}
+        else:
+            self._attr_extra_state_attributes = _EMPTY_ATTRS # type: ignore[assignment]
+
+        self._fp = fp
+
+    def _valve_position(self, device: MaxDevice) -> int:
+        """Return the valve position driving this entity's HVAC action."""
+        valve = 0
+        if self._has_valve and self._is_thermo:
+            valve = device.valve_position
+        elif self._is_wall:
+            # Find the highest valve position among the room's thermostats
+            for dev in self.coordinator.data.thermostats_by_room.get(device.room_id, ()):
+                dev_valve = getattr(dev, 'valve_position', None)
+                if dev_valve is not None and dev_valve > valve:
+                    valve = dev_valve
+        return valve
+
+    def _fingerprint(self, device: MaxDevice) -> _Fingerprint:
+        """Return the device values that determine this entity's state."""
+        return _Fingerprint(
+            device.mode,
+            device.target_temperature,
+            device.actual_temperature,
+            self._valve_position(device),
+            device.comfort_temperature,
+            device.eco_temperature,
+            self.coordinator.last_update_success,
+        )
 
     def _get_current_preset(self) -> str | None:
         """Return the current preset mode based on device state."""
@@ -221,22 +280,6 @@ class MaxCubeClimate(CoordinatorEntity[MaxCubeDataUpdateCoordinator], ClimateEnt
         # If no specific preset matches, return None (represents 'none' or 'auto' schedule)
         return None
 
-    @property
-    def min_temp(self) -> float:
-        """Return the minimum temperature."""
-        # Use device min_temp if available, otherwise default MIN_TEMPERATURE
-        min_t = getattr(self._device, 'min_temperature', MIN_TEMPERATURE) or MIN_TEMPERATURE
-        # Ensure it's not below the absolute minimum usable value
-        return max(min_t, MIN_TEMPERATURE)
-
-    @property
-    def max_temp(self) -> float:
-        """Return the maximum temperature."""
-        # Use device max_temp if available, otherwise default MAX_TEMPERATURE
-        max_t = getattr(self._device, 'max_temperature', MAX_TEMPERATURE) or MAX_TEMPERATURE
-        # Ensure it's not above the absolute maximum usable value
-        return min(max_t, MAX_TEMPERATURE)
-
     @property
     def preset_modes(self) -> list[str] | None:
         """Return a list of available preset modes."""
@@ -307,22 +350,13 @@ class MaxCubeClimate(CoordinatorEntity[MaxCubeDataUpdateCoordinator], ClimateEnt
     async def _async_set_temperature_mode(self, temperature: float | None, mode: int | None) -> None:
         """Send temperature and mode command to the MAX! Cube.
 
-        Runs the blocking call in the executor.
+        The coordinator batches commands and sends them in the executor.
         """
-        # Use the cube object from the coordinator
-        cube = self.coordinator.cube
-
         try:
-            # Run blocking network I/O in executor
-            await self.hass.async_add_executor_job(
-                cube.set_temperature_mode, self._device, temperature, mode
-            )
-            # After sending command, request a refresh to get updated state
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_set_temperature_mode(self._device, temperature, mode)
         except (TimeoutError, OSError) as err:
             _LOGGER.error("Error setting temperature/mode for %s: %s", self.unique_id, err)
-            # Optionally re-raise or handle specific errors
             raise HomeAssistantError(f"Failed to set mode/temperature: {err}") from err
         except Exception as err: # Catch other potential library errors
-             _LOGGER.error("Unexpected error setting temperature/mode for %s: %s", self.unique_id, err)
-             raise HomeAssistantError(f"Unexpected error setting mode/temperature: {err}") from err
+            _LOGGER.error("Unexpected error setting temperature/mode for %s: %s", self.unique_id, err)
+            raise HomeAssistantError(f"Unexpected error setting mode/temperature: {err}") from err
@@ -1,5 +1,6 @@
 """Config flow for eQ-3 MAX! Cube."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -16,13 +17,31 @@ from .const import DEFAULT_PORT, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound (seconds) for connecting to the cube during validation
+PROBE_TIMEOUT = 20
+
+# Config entry title template, bound once at import
+_format_title = "MAX! Cube ({})".format
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
-        vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
+        vol.Optional(CONF_PORT, default=DEFAULT_PORT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=65535)
+        ),
     }
 )
 
+def _probe_cube(host: str, port: int) -> str:
+    """Connect to the cube, read its serial and disconnect (runs in executor)."""
+    cube = MaxCube(host, port, now)
+    try:
+        return cube.serial
+    finally:
+        # Ensure connection is closed after validation
+        cube.disconnect()
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
@@ -32,21 +51,25 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     port = data[CONF_PORT]
 
     try:
-        # Run blocking network I/O in executor
-        cube = await hass.async_add_executor_job(MaxCube, host, port, now)
-        # Ensure connection is closed after validation
-        await hass.async_add_executor_job(cube.disconnect)
+        # Run blocking network I/O in a single executor job.
+        # wait_for can't interrupt the worker thread; the library's own
+        # socket timeouts bound it, this bounds how long the flow waits.
+        serial = await asyncio.wait_for(
+            hass.async_add_executor_job(_probe_cube, host, port),
+            timeout=PROBE_TIMEOUT,
+        )
 
-    except TimeoutError as exc:
+    except (TimeoutError, asyncio.TimeoutError) as exc:
         _LOGGER.error("Unable to connect to Max!Cube gateway: %s", exc)
         raise CannotConnect from exc
-    except Exception as exc: # Catch other potential exceptions during connection
-        _LOGGER.error("Unexpected error connecting to Max!Cube gateway: %s", exc)
+    except (OSError, ConnectionError) as exc: # Network errors during connection
+        _LOGGER.error("Error connecting to Max!Cube gateway: %s", exc)
         raise CannotConnect from exc # Raise specific error for flow
+    # Other exceptions are unexpected and logged by the flow step
 
     # Return info that you want to store in the config entry.
     # Use cube serial as unique ID to prevent duplicate entries
-    return {"title": f"MAX! Cube ({host})", "unique_id": cube.serial}
+    return {"title": _format_title(host), "unique_id": serial}
 
 
 class MaxCubeConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -60,23 +83,34 @@ class MaxCubeConfigFlow(ConfigFlow, domain=DOMAIN):
         """Handle the initial step."""
         errors: dict[str, str] = {}
         if user_input is not None:
+            # Cheap host/port check first so a known cube is not probed again.
+            # The unique ID check below remains the authoritative guard.
+            self._async_abort_entries_match(
+                {CONF_HOST: user_input[CONF_HOST], CONF_PORT: user_input[CONF_PORT]}
+            )
             try:
                 # Validate the user input
                 info = await validate_input(self.hass, user_input)
-                # Set unique ID before creating entry
-                await self.async_set_unique_id(info["unique_id"])
-                self._abort_if_unique_id_configured()
-
-                return self.async_create_entry(title=info["title"], data=user_input)
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
+            else:
+                # Set unique ID before creating entry. Kept outside the try so
+                # the AbortFlow raised for a known serial is not swallowed.
+                await self.async_set_unique_id(info["unique_id"])
+                self._abort_if_unique_id_configured()
+
+                return self.async_create_entry(title=info["title"], data=user_input)
 
-        # Show the form to the user
+        # Show the form to the user, keeping previously entered values
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="user",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_USER_DATA_SCHEMA, user_input or {}
+            ),
+            errors=errors,
         )
 
 
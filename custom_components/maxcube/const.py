@@ -2,7 +2,6 @@
 
 DOMAIN = "maxcube"
 DEFAULT_PORT = 62910
-SCAN_INTERVAL = 300
 
 # Store the MaxCubeHandle instance
 DATA_MAXCUBE_HANDLE = "maxcube_handle"
@@ -0,0 +1 @@
+"""Tests for the eQ-3 MAX! Cube integration."""
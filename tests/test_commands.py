@@ -0,0 +1,96 @@
+"""Tests for the MAX! Cube coordinator command queue."""
+
+import asyncio
+from datetime import timedelta
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.maxcube import MaxCubeDataUpdateCoordinator
+
+
+def _mock_device(rf_address: str) -> MagicMock:
+    """Return a mock MAX! device."""
+    device = MagicMock()
+    device.rf_address = rf_address
+    device.serial = f"SERIAL{rf_address}"
+    return device
+
+
+@pytest.fixture
+def coordinator(hass: HomeAssistant):
+    """Return a coordinator wired to a mock cube."""
+    coordinator = MaxCubeDataUpdateCoordinator(
+        hass, "127.0.0.1", 62910, timedelta(seconds=30)
+    )
+    cube = MagicMock()
+    cube.devices = []
+    live_devices = {rf: _mock_device(rf) for rf in ("A", "B")}
+    cube.device_by_rf.side_effect = live_devices.get
+    coordinator.cube = cube
+    yield coordinator
+    coordinator.async_unload()
+
+
+async def test_command_during_inflight_flush(
+    hass: HomeAssistant, coordinator: MaxCubeDataUpdateCoordinator
+) -> None:
+    """A command queued while a batch is being sent goes out in the next batch."""
+    sending = threading.Event()
+    release = threading.Event()
+    sent: list[str] = []
+
+    def set_temperature_mode(device, temperature, mode):
+        sent.append(device.rf_address)
+        if device.rf_address == "A":
+            sending.set()
+            release.wait(5)
+        return True
+
+    coordinator.cube.set_temperature_mode.side_effect = set_temperature_mode
+
+    task_a = hass.async_create_task(
+        coordinator.async_set_temperature_mode(_mock_device("A"), 21.0, 1)
+    )
+    # Wait until the first batch is blocked in the executor
+    await hass.async_add_executor_job(sending.wait, 5)
+    task_b = hass.async_create_task(
+        coordinator.async_set_temperature_mode(_mock_device("B"), 19.0, 1)
+    )
+    # Keep the first batch in flight past the flush cooldown
+    await asyncio.sleep(0.5)
+    release.set()
+
+    await asyncio.wait_for(asyncio.gather(task_a, task_b), timeout=5)
+    assert sent == ["A", "B"]
+    await hass.async_block_till_done()
+
+
+async def test_failed_command_raises(
+    hass: HomeAssistant, coordinator: MaxCubeDataUpdateCoordinator
+) -> None:
+    """An unconfirmed command fails the caller's service call."""
+    coordinator.cube.set_temperature_mode.return_value = False
+
+    with pytest.raises(OSError):
+        await asyncio.wait_for(
+            coordinator.async_set_temperature_mode(_mock_device("A"), 21.0, 1),
+            timeout=5,
+        )
+
+
+async def test_command_after_shutdown_raises(
+    hass: HomeAssistant, coordinator: MaxCubeDataUpdateCoordinator
+) -> None:
+    """Commands fail immediately once the queue has been shut down."""
+    coordinator.async_shutdown_commands()
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(
+            coordinator.async_set_temperature_mode(_mock_device("A"), 21.0, 1),
+            timeout=1,
+        )
+    coordinator.cube.set_temperature_mode.assert_not_called()